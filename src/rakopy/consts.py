@@ -1,3 +1,6 @@
 """Constants for rakopy module."""
 
 DEFAULT_PORT = 9762
+DEFAULT_TOPOLOGY_TTL = 60
+KEEPALIVE_INTERVAL = 30
+KEEPALIVE_TIMEOUT = 10
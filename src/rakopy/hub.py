@@ -5,8 +5,13 @@ import logging
 
 import asyncio
 import json
-from typing import Any, AsyncGenerator, List
-from rakopy.consts import DEFAULT_PORT
+import socket
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Tuple
+from rakopy.consts import DEFAULT_PORT, DEFAULT_TOPOLOGY_TTL, KEEPALIVE_TIMEOUT
 from rakopy.errors import ConfigValidationError, SendCommandError
 from rakopy.model import (
     Channel,
@@ -22,6 +27,178 @@ from rakopy.model import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_READ_CHUNK_SIZE = 65536
+_LINE_TERMINATOR = b"\r\n"
+
+_STATUS_REQUEST = b'{"name": "status", "payload": {}}\r\n'
+# Variable values are inserted JSON encoded, so they are sent exactly as
+# json.dumps would send them.
+_QUERY_REQUEST = b'{"name": "query", "payload": {"queryType": "%b", "roomId": %b}}\r\n'
+_SEND_REQUEST = b'{"name": "send", "payload": {"room": %b, "channel": %b, "action": %b}}'
+_LEVEL_ACTION = b'{"command": "levelrate", "level": %b}'
+_SCENE_ACTION = b'{"command": "scene", "scene": %b}'
+_STORE_ACTION = b'{"command": "store", "scene": %b}'
+_FADE_DOWN_ACTION = str.encode(json.dumps({"command": "fade", "down": True}))
+_FADE_UP_ACTION = str.encode(json.dumps({"command": "fade", "down": False}))
+_STOP_ACTION = str.encode(json.dumps({"command": "stop"}))
+
+# Hub and requests collected by the innermost Hub.batch() block of the current task.
+_BATCH: ContextVar[Tuple[Hub, List[bytes]]] = ContextVar("rakopy_batch", default = None)
+
+
+def _validate_config(
+    client_name: str,
+    host: str,
+    port: int,
+    topology_ttl: float,
+    pool_size: int,
+    keepalive_interval: float
+) -> Tuple[str, str, int]:
+    """
+    Validates connection configuration and returns cleaned up values.
+    """
+    host = host.strip() if host else ""
+    if not host:
+        raise ConfigValidationError("RakoHub: host parameter cannot be empty.")
+
+    if port < 0 or port > 65535:
+        raise ConfigValidationError("RakoHub: port should be between 0 and 65535.")
+
+    client_name = client_name.strip() if client_name else ""
+    if not client_name:
+        raise ConfigValidationError("RakoHub: client_name parameter cannot be empty.")
+
+    if topology_ttl < 0:
+        raise ConfigValidationError("RakoHub: topology_ttl cannot be negative.")
+
+    if pool_size < 1:
+        raise ConfigValidationError("RakoHub: pool_size should be at least 1.")
+
+    if keepalive_interval is not None and keepalive_interval <= 0:
+        raise ConfigValidationError("RakoHub: keepalive_interval should be positive.")
+
+    return client_name, host, port
+
+
+class _Connection:
+    """Line oriented connection to Rako Hub."""
+    def __init__(self, sock: socket.socket):
+        self._loop = asyncio.get_running_loop()
+        self._sock = sock
+        self._rxbuf = bytearray(_READ_CHUNK_SIZE)
+        self._rxstart = 0
+        self._rxend = 0
+
+    @classmethod
+    async def open(cls, host: str, port: int) -> _Connection:
+        """
+        Opens a new connection to Rako Hub.
+        """
+        loop = asyncio.get_running_loop()
+        addresses = await loop.getaddrinfo(host, port, type = socket.SOCK_STREAM)
+
+        error = OSError(f"Could not connect to {host}:{port}.")
+        for family, sock_type, proto, _, address in addresses:
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                sock.setblocking(False)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                await loop.sock_connect(sock, address)
+            except OSError as e:
+                sock.close()
+                error = e
+                continue
+            except BaseException:
+                sock.close()
+                raise
+
+            return cls(sock)
+
+        raise error
+
+    def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self._sock.close()
+
+    def is_closed(self) -> bool:
+        """
+        Returns True if the connection is closed.
+        """
+        return self._sock.fileno() == -1
+
+    async def write(self, data: bytes) -> None:
+        """
+        Writes data and waits until it is sent.
+        """
+        try:
+            await self._loop.sock_sendall(self._sock, data)
+        except OSError:
+            self.close()
+            raise
+
+    async def writelines(self, data: List[bytes]) -> None:
+        """
+        Writes several chunks of data at once and waits until they are sent.
+        """
+        await self.write(b"".join(data))
+
+    async def read_line(self) -> bytes:
+        """
+        Reads a single line, without the "\r\n" or "\n" line terminator.
+        Data is received directly into a preallocated buffer, which only grows
+        when a single line does not fit into it.
+        """
+        start = self._rxstart
+        while True:
+            idx = self._rxbuf.find(b"\n", start, self._rxend)
+            if idx >= 0:
+                end = idx
+                if end > self._rxstart and self._rxbuf[end - 1] == 0x0D:
+                    end -= 1
+
+                line = bytes(memoryview(self._rxbuf)[self._rxstart:end])
+                self._rxstart = idx + 1
+
+                if self._rxstart == self._rxend:
+                    self._rxstart = self._rxend = 0
+                    if len(self._rxbuf) > _READ_CHUNK_SIZE:
+                        del self._rxbuf[_READ_CHUNK_SIZE:]
+
+                return line
+
+            if self._rxend == len(self._rxbuf):
+                self._make_room()
+
+            # Only newly received data needs to be scanned for a terminator.
+            start = self._rxend
+            try:
+                nbytes = await self._loop.sock_recv_into(
+                    self._sock, memoryview(self._rxbuf)[self._rxend:]
+                )
+            except OSError:
+                self.close()
+                raise
+
+            if not nbytes:
+                self.close()
+                raise ConnectionError("Connection closed by Rako Hub.")
+            self._rxend += nbytes
+
+    def _make_room(self) -> None:
+        """
+        Makes room at the end of the receive buffer, by discarding consumed
+        data or, if there is none, by growing the buffer.
+        """
+        if self._rxstart:
+            size = self._rxend - self._rxstart
+            self._rxbuf[:size] = self._rxbuf[self._rxstart:self._rxend]
+            self._rxstart = 0
+            self._rxend = size
+        else:
+            self._rxbuf.extend(bytes(len(self._rxbuf)))
+
 
 class Hub:
     """Class to integrate with Rako Hub."""
@@ -29,41 +206,77 @@ class Hub:
         self,
         client_name: str,
         host: str,
-        port: int = DEFAULT_PORT
+        port: int = DEFAULT_PORT,
+        topology_ttl: float = DEFAULT_TOPOLOGY_TTL,
+        pool_size: int = 1,
+        keepalive_interval: float = None
     ):
-        host = host.strip()
-        if not host:
-            raise ConfigValidationError("RakoHub: host parameter cannot be empty.")
+        self.client_name, self.host, self.port = _validate_config(
+            client_name, host, port, topology_ttl, pool_size, keepalive_interval
+        )
+        self.topology_ttl = topology_ttl
+        self.keepalive_interval = keepalive_interval
+
+        # Connections are opened lazily, empty slots are represented by None.
+        # The pool is LIFO so that an open connection is reused before an empty
+        # slot, and extra connections are only opened for concurrent calls.
+        # The pool is set to None when the hub is closed.
+        self._pool: asyncio.Queue[_Connection | None] = asyncio.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put_nowait(None)
+
+        self._topology_cache: Dict[int, Tuple[float, bytes]] = {}
+        self._keepalive_task: asyncio.Task = None
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Collect commands sent within the block and send them in a single write
+        when the block exits.
+        Applies to all set_*, store_scene and fading methods. Any error for the
+        collected commands is raised when the block exits.
+        """
+        requests = []
+        token = _BATCH.set((self, requests))
+        try:
+            yield
+        finally:
+            _BATCH.reset(token)
 
-        if port < 0 or port > 65535:
-            raise ConfigValidationError("RakoHub: port should be between 0 and 65535.")
+        if requests:
+            await self._send_batch(requests)
 
-        if not client_name:
-            raise ConfigValidationError("RakoHub: client_name parameter cannot be empty.")
+    async def close(self) -> None:
+        """
+        Stop the keepalive and close the connections to the Rako Hub.
+        Connections used by calls still in flight are closed when those calls
+        complete. The hub cannot be used after it was closed.
+        """
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
 
-        self.host = host
-        self.port = port
-        self.client_name = client_name
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
 
-        self._lock = asyncio.Lock()
-        self._reader = None
-        self._writer = None
+        while not pool.empty():
+            connection = pool.get_nowait()
+            if connection is not None:
+                connection.close()
 
     async def get_hub_status(self) -> HubStatus:
         """
         Get Rako Hub status.
         """
-        await self._reconnect()
+        async with self._acquire() as connection:
+            await connection.write(_STATUS_REQUEST)
+            response = await connection.read_line()
 
-        request = {
-            "name": "status",
-            "payload": {}
-        }
-
-        self._writer.write(str.encode(json.dumps(request) + "\r\n"))
-        await self._writer.drain()
-
-        response = await self._reader.readline()
         json_data = json.loads(response)
 
         return HubStatus(
@@ -85,19 +298,29 @@ class Hub:
         """
         Get room by its id.
         If room_id is not specified, returns all rooms.
+        Responses are cached for topology_ttl seconds. Cached responses are parsed
+        again on every call, so callers always get their own Room objects.
+        """
+        cached = self._topology_cache.get(room_id)
+        if cached is not None and time.monotonic() - cached[0] < self.topology_ttl:
+            response = cached[1]
+        else:
+            response = await self._query_response("SCENECHANNEL", room_id)
+            self._topology_cache[room_id] = (time.monotonic(), response)
+
+        return self._parse_query_response(response, self._to_room)
+
+    def invalidate_topology(self) -> None:
+        """
+        Clear cached rooms, so that the next get_rooms call queries the Hub.
         """
-        return await self._query("SCENECHANNEL", self._to_room, room_id)
+        self._topology_cache.clear()
 
     async def set_level(self, room_id: int, channel_id: int, level: int) -> None:
         """
         Set level for a given room and channel.
         """
-        action = {
-            "command": "levelrate",
-            "level": level
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _LEVEL_ACTION % self._encode(level))
 
         await self._send(request)
 
@@ -132,18 +355,13 @@ class Hub:
             }
         }
 
-        await self._send(request)
+        await self._send(self._encode(request))
 
     async def set_scene(self, room_id: int, channel_id: int, scene: int) -> None:
         """
         Set a scene for a given room and channel.
         """
-        action = {
-            "command": "scene",
-            "scene": scene
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _SCENE_ACTION % self._encode(scene))
 
         await self._send(request)
 
@@ -172,18 +390,13 @@ class Hub:
             }
         }
 
-        await self._send(request)
+        await self._send(self._encode(request))
 
     async def start_fading_down(self, room_id: int, channel_id: int) -> None:
         """
         Start fading down brightness for a given room and channel
         """
-        action = {
-            "command": "fade",
-            "down": True
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _FADE_DOWN_ACTION)
 
         await self._send(request)
 
@@ -191,12 +404,7 @@ class Hub:
         """
         Start fading up brightness for a given room and channel.
         """
-        action = {
-            "command": "fade",
-            "down": False
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _FADE_UP_ACTION)
 
         await self._send(request)
 
@@ -204,11 +412,7 @@ class Hub:
         """
         Stop fading brightness for a given room and channel
         """
-        action = {
-            "command": "stop"
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _STOP_ACTION)
 
         await self._send(request)
 
@@ -216,12 +420,7 @@ class Hub:
         """
         Store current levels as a scene for a given room and channel.
         """
-        action = {
-            "command": "store",
-            "scene": scene
-        }
-
-        request = self._build_send_request(room_id, channel_id, action)
+        request = self._build_send_request(room_id, channel_id, _STORE_ACTION % self._encode(scene))
 
         await self._send(request)
 
@@ -232,6 +431,11 @@ class Hub:
         reader: asyncio.StreamReader = None
         writer: asyncio.StreamWriter = None
 
+        parsers = {
+            "scene": self._to_scene_changed_event,
+            "level": self._to_level_changed_event
+        }
+
         while True:
             if (writer is None or
                 writer.transport is None or
@@ -239,161 +443,261 @@ class Hub:
             ):
                 reader, writer = await asyncio.open_connection(self.host, self.port)
 
-            payload = {
-                "version": 2,
-                "client_name": self.client_name,
-                "subscriptions": ["TRACKER"]
-            }
-            request = f"SUB,JSON,{json.dumps(payload)}\r\n"
-
-            writer.write(str.encode(request))
-            await writer.drain()
+            # The subscription request is tiny and is flushed while waiting for
+            # events below, so there is no need to wait for drain().
+            writer.write(self._build_subscribe_request(self.client_name, ("TRACKER",)))
 
             try:
                 while True:
                     response = await reader.readline()
                     json_data = json.loads(response)
-                    if json_data["name"] == "tracker":
-                        if json_data["type"] == "scene":
-                            yield SceneChangedEvent(
-                                room_id = json_data["payload"]["roomId"],
-                                channel_id = json_data["payload"]["channelId"],
-                                scene_id = json_data["payload"]["scene"],
-                                active_scene_id = json_data["payload"]["activeScene"],
-                            )
-                        elif json_data["type"] == "level":
-                            level_changed_event = LevelChangedEvent(
-                                room_id = json_data["payload"]["roomId"],
-                                channel_id = json_data["payload"]["channelId"],
-                                current_level = json_data["payload"]["currentLevel"],
-                                target_level = json_data["payload"]["targetLevel"],
-                                time_to_take = json_data["payload"]["timeToTake"],
-                                temporary = json_data["payload"]["temporary"],
-                            )
-                            yield level_changed_event
+                    if json_data["name"] != "tracker":
+                        continue
+
+                    parser = parsers.get(json_data["type"])
+                    if parser is not None:
+                        yield parser(json_data["payload"])
             except ConnectionError as e:
                 _LOGGER.exception("Unexpected exception: %s", repr(e))
 
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[_Connection]:
+        """
+        Take a connection from the pool for exclusive use, connecting to the
+        Rako Hub if the connection was not previously established or was closed.
+        """
+        pool = self._pool
+        if pool is None:
+            raise ConnectionError("RakoHub: hub was closed.")
+
+        connection = await pool.get()
+        try:
+            if self._pool is not pool:
+                raise ConnectionError("RakoHub: hub was closed.")
+            if connection is None or connection.is_closed():
+                connection = await self._connect()
+            yield connection
+        except BaseException:
+            # The connection may be left in the middle of a response.
+            if connection is not None:
+                connection.close()
+            raise
+        finally:
+            # Connections returned after close() are closed, the empty slot is
+            # still put back to wake up calls waiting for the pool.
+            if self._pool is not pool and connection is not None:
+                connection.close()
+                connection = None
+            pool.put_nowait(connection)
+
+    async def _connect(self) -> _Connection:
+        """
+        Open a new connection to the Rako Hub.
+        """
+        connection = await _Connection.open(self.host, self.port)
+        try:
+            await connection.write(self._build_subscribe_request(self.client_name, ()))
+            await connection.read_line()
+        except BaseException:
+            connection.close()
+            raise
+
+        if self.keepalive_interval is not None and self._pool is not None and (
+            self._keepalive_task is None or self._keepalive_task.done()
+        ):
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+        return connection
+
+    async def _keepalive(self) -> None:
+        """
+        Periodically ping every idle open connection in the pool, so that the
+        connections stay open and a dropped one is noticed before the next call.
+        Empty slots are left alone, the keepalive never opens connections.
+        Only runs if keepalive_interval is set, until close() is called.
+        """
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+
+            pool = self._pool
+            if pool is None:
+                return
+
+            idle = []
+            while not pool.empty():
+                idle.append(pool.get_nowait())
+            connections = [
+                connection for connection in idle
+                if connection is not None and not connection.is_closed()
+            ]
+
+            alive = []
+            try:
+                results = await asyncio.gather(
+                    *(asyncio.wait_for(self._ping(connection), KEEPALIVE_TIMEOUT)
+                      for connection in connections),
+                    return_exceptions = True
+                )
+                for connection, result in zip(connections, results):
+                    if isinstance(result, BaseException):
+                        _LOGGER.debug("Rako Hub keepalive failed: %s", repr(result))
+                    else:
+                        alive.append(connection)
+            finally:
+                # A failed, timed out or interrupted ping may leave the
+                # connection in the middle of a response, so it is closed and
+                # the next call reconnects instead of using a dead socket.
+                for connection in connections:
+                    if connection not in alive:
+                        connection.close()
+
+                # Empty slots go back first, so open connections stay on top of
+                # the LIFO pool and are reused before new ones are opened.
+                for _ in range(len(idle) - len(alive)):
+                    pool.put_nowait(None)
+                for connection in alive:
+                    pool.put_nowait(connection)
+
+    @staticmethod
+    async def _ping(connection: _Connection) -> None:
+        """
+        Sends a status request and discards the response.
+        """
+        await connection.write(_STATUS_REQUEST)
+        await connection.read_line()
+
     async def _query(self, query_type: str, func, room_id: int = None):
         """
         Executes query and returns result.
         """
-        await self._reconnect()
+        response = await self._query_response(query_type, room_id)
 
-        await self._lock.acquire()
-        try:
-            if room_id is None:
-                room_id = 0
-
-            request = {
-                "name": "query",
-                "payload": {
-                    "queryType": query_type,
-                    "roomId": room_id
-                }
-            }
+        return self._parse_query_response(response, func)
 
-            self._writer.write(str.encode(json.dumps(request) + "\r\n"))
-            await self._writer.drain()
+    async def _query_response(self, query_type: str, room_id: int = None) -> bytes:
+        """
+        Executes query and returns the raw response.
+        """
+        if room_id is None:
+            room_id = 0
 
-            response = (await self._reader.readline()).decode()
-            json_data = json.loads(response)
+        async with self._acquire() as connection:
+            await connection.write(self._build_query_request(query_type, room_id))
+            return await connection.read_line()
 
-            result = []
-            for data in json_data["payload"]:
-                result.append(func(data))
+    async def _send(self, request: bytes) -> None:
+        """
+        Sends a command, or adds it to the current batch.
+        """
+        batch = _BATCH.get()
+        if batch is not None and batch[0] is self:
+            batch[1].append(request)
+            return
 
-            return result
-        finally:
-            self._lock.release()
+        await self._send_batch([request])
 
-    async def _reconnect(self) -> None:
+    async def _send_batch(self, requests: List[bytes]) -> None:
         """
-        Try to reconnect to the Rako Hub if the connection was not previously
-        established or was closed.
+        Sends several commands in a single write and waits for all responses.
         """
-        await self._lock.acquire()
-        try:
-            if (self._writer is None or
-                self._writer.transport is None or
-                self._writer.transport.is_closing()
-            ):
-                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        parts = []
+        for request in requests:
+            parts.append(request)
+            parts.append(_LINE_TERMINATOR)
 
-                payload = {
-                    "version": 2,
-                    "client_name": self.client_name,
-                    "subscriptions": []
-                }
-                request = f"SUB,JSON,{json.dumps(payload)}\r\n"
+        errors = []
+        async with self._acquire() as connection:
+            await connection.writelines(parts)
 
-                self._writer.write(str.encode(request))
-                await self._writer.drain()
+            # Every response has to be consumed to keep the connection in sync,
+            # even if one of the commands failed.
+            for request in requests:
+                response = await connection.read_line()
+                json_data = json.loads(response)
+                if json_data["name"] == "error":
+                    errors.append((request, json_data["payload"]))
 
-                await self._reader.readline()
-        finally:
-            self._lock.release()
+        if errors:
+            request, error = errors[0]
+            raise SendCommandError(
+                f"Failed to send {request.decode()} command. Error: {error}"
+            )
 
-    async def _send(self, request: Any) -> None:
+    @staticmethod
+    def _build_send_request(room_id: int, channel_id: int, action: bytes) -> bytes:
         """
-        Sends a command.
+        Returns an encoded send command request for an encoded action.
         """
-        await self._reconnect()
+        return _SEND_REQUEST % (Hub._encode(room_id), Hub._encode(channel_id), action)
 
-        await self._lock.acquire()
-        try:
-            self._writer.write(str.encode(json.dumps(request) + "\r\n"))
-            await self._writer.drain()
-
-            response = (await self._reader.readline()).decode()
-            json_data = json.loads(response)
-            if json_data["name"] == "error":
-                raise SendCommandError(
-                    f"Failed to send {0} command. Error: {1}", request, json_data["payload"]
-                )
-        finally:
-            self._lock.release()
+    @staticmethod
+    def _build_query_request(query_type: str, room_id: int) -> bytes:
+        """
+        Returns an encoded query request.
+        """
+        return _QUERY_REQUEST % (query_type.encode(), Hub._encode(room_id))
 
     @staticmethod
-    def _build_send_request(room_id: int, channel_id: int, action: Any):
+    @lru_cache(maxsize=16)
+    def _build_subscribe_request(client_name: str, subscriptions: Tuple[str, ...]) -> bytes:
         """
-        Returns a send command request.
+        Returns an encoded subscription request.
+        Cached, as it is sent on every reconnect with the same arguments. The
+        cache is bounded since it is shared by all Hub instances.
         """
-        return {
-            "name": "send",
-            "payload": {
-                "room": room_id,
-                "channel": channel_id,
-                "action": action
-            }
+        payload = {
+            "version": 2,
+            "client_name": client_name,
+            "subscriptions": list(subscriptions)
         }
 
+        return str.encode(f"SUB,JSON,{json.dumps(payload)}\r\n")
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        """
+        Encodes data as JSON bytes.
+        """
+        return str.encode(json.dumps(data))
+
+    @staticmethod
+    def _parse_query_response(response: bytes, func) -> List[Any]:
+        """
+        Converts a raw query response to a list of results using func.
+        """
+        json_data = json.loads(response)
+
+        return [func(data) for data in json_data["payload"]]
+
+    @staticmethod
+    def _to_level_changed_event(data: Any) -> LevelChangedEvent:
+        """
+        Converts JSON data to LevelChangedEvent.
+        """
+        return LevelChangedEvent(
+            room_id = data["roomId"],
+            channel_id = data["channelId"],
+            current_level = data["currentLevel"],
+            target_level = data["targetLevel"],
+            time_to_take = data["timeToTake"],
+            temporary = data["temporary"],
+        )
+
     @staticmethod
     def _to_level(data: Any) -> Level:
         """
-        Converts list of str to Level.
-        """
-        channel_levels = []
-        for channel_level in data["channel"]:
-            level_info_data = channel_level["levelInfo"]
-            if level_info_data:
-                level_info = LevelInfo(
-                    kelvin = level_info_data["kelvin"],
-                    red = level_info_data["red"],
-                    green = level_info_data["green"],
-                    blue = level_info_data["blue"]
-                )
-            else:
-                level_info = None
-
-            channel_levels.append(
-                ChannelLevel(
-                    channel_id = channel_level["channelId"],
-                    current_level = channel_level["currentLevel"],
-                    target_level = channel_level["targetLevel"],
-                    level_info = level_info
-                )
+        Converts JSON data to Level.
+        """
+        to_level_info = Hub._to_level_info
+        channel_levels = [
+            ChannelLevel(
+                channel_id = channel_level["channelId"],
+                current_level = channel_level["currentLevel"],
+                target_level = channel_level["targetLevel"],
+                level_info = to_level_info(channel_level["levelInfo"])
             )
+            for channel_level in data["channel"]
+        ]
 
         return Level(
             room_id = data["roomId"],
@@ -401,39 +705,51 @@ class Hub:
             channel_levels = channel_levels
         )
 
+    @staticmethod
+    def _to_level_info(data: Any) -> LevelInfo:
+        """
+        Converts JSON data to LevelInfo, or None if there is no level info.
+        """
+        if not data:
+            return None
+
+        return LevelInfo(
+            kelvin = data["kelvin"],
+            red = data["red"],
+            green = data["green"],
+            blue = data["blue"]
+        )
+
     @staticmethod
     def _to_room(data: Any) -> Room:
         """
         Converts JSON data to Room.
         """
-        channels = []
-        for channel in data["channel"]:
-            channels.append(
-                Channel(
-                    id = channel["channelId"],
-                    title = channel["title"],
-                    type = channel["type"],
-                    color_type = channel["colorType"],
-                    color_title = channel["colorTitle"],
-                    multi_channel_component = channel["multiChannelComponent"]
-                )
+        channels = [
+            Channel(
+                id = channel["channelId"],
+                title = channel["title"],
+                type = channel["type"],
+                color_type = channel["colorType"],
+                color_title = channel["colorTitle"],
+                multi_channel_component = channel["multiChannelComponent"]
             )
+            for channel in data["channel"]
+        ]
 
-        scenes = []
-        scenes.append(
+        scenes = [
             Scene(
                 id = 0,
                 title = "Off"
             )
-        )
-
-        for scene in data["scene"]:
-            scenes.append(
-                Scene(
-                    id = scene["sceneId"],
-                    title = scene["title"]
-                )
+        ]
+        scenes.extend(
+            Scene(
+                id = scene["sceneId"],
+                title = scene["title"]
             )
+            for scene in data["scene"]
+        )
 
         return Room(
             id = data["roomId"],
@@ -443,3 +759,15 @@ class Hub:
             channels = channels,
             scenes = scenes
         )
+
+    @staticmethod
+    def _to_scene_changed_event(data: Any) -> SceneChangedEvent:
+        """
+        Converts JSON data to SceneChangedEvent.
+        """
+        return SceneChangedEvent(
+            room_id = data["roomId"],
+            channel_id = data["channelId"],
+            scene_id = data["scene"],
+            active_scene_id = data["activeScene"],
+        )
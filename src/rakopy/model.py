@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from typing import List
 
-@dataclass
+@dataclass(slots=True)
 class HubStatus:
     """Hub status data model."""
     product_type: str
@@ -12,7 +12,7 @@ class HubStatus:
     mac_address: str
     version: str
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     """Channel data model."""
     id: int
@@ -22,13 +22,13 @@ class Channel:
     color_title: str
     multi_channel_component: str
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """Scene data model."""
     id: int
     title: int
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """Room data model."""
     id: int
@@ -38,7 +38,7 @@ class Room:
     channels: List[Channel]
     scenes: List[Scene]
 
-@dataclass
+@dataclass(slots=True)
 class LevelInfo:
     """Channel level info data model."""
     kelvin: int
@@ -46,7 +46,7 @@ class LevelInfo:
     green: int
     blue: int
 
-@dataclass
+@dataclass(slots=True)
 class ChannelLevel:
     """Channel level data model."""
     channel_id: int
@@ -54,14 +54,14 @@ class ChannelLevel:
     target_level: int
     level_info: LevelInfo
 
-@dataclass
+@dataclass(slots=True)
 class Level:
     """Level data model."""
     room_id: int
     current_scene_id: int
     channel_levels: List[ChannelLevel]
 
-@dataclass
+@dataclass(slots=True)
 class LevelChangedEvent:
     """Level changed event data model."""
     room_id: int
@@ -71,7 +71,7 @@ class LevelChangedEvent:
     time_to_take: int
     temporary: bool
 
-@dataclass
+@dataclass(slots=True)
 class SceneChangedEvent:
     """Scene changed event data model."""
     room_id: int